@@ -23,6 +23,21 @@ class Account():
         self.maintenance_margin = 0.0
         self.positions = positions if positions is not None else []
         self.ledger = ledger if ledger is not None else []
+        self._positions_by_symbol = {}
+
+    def _rebuild_positions_index(self):
+        """
+        Rebuild the symbol -> [Position] index from self.positions.
+        fill_order refreshes this on entry and keeps it in sync while it works,
+        so scans over matching positions are O(positions on that symbol)
+        instead of O(all positions). Code that mutates self.positions directly
+        can ignore it; the next fill rebuilds it.
+        """
+        index = {}
+        for position in self.positions:
+            index.setdefault(position.asset.symbol, []).append(position)
+        self._positions_by_symbol = index
+        return index
 
 
 
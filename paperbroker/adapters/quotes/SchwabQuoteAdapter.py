@@ -26,7 +26,9 @@ NOTE: assets.py parsing is enhanced (see assets_patched.py) to normalize OCC opt
 with padded spaces like "AAPL  250119C00150000".
 """
 
+import sys
 import threading
+import time
 import arrow
 
 from .QuoteAdapter import QuoteAdapter
@@ -34,6 +36,59 @@ from ...assets import asset_factory
 from ...quotes import quote_factory_from_service
 
 
+def _num_slow(x):
+    try:
+        return float(x)
+    except Exception:
+        return None
+
+def _num(x):
+    # exact type checks dispatch the common numeric payloads without
+    # touching the exception machinery; strings etc. take the slow path
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
+    if x is None:
+        return None
+    return _num_slow(x)
+
+def _size(x):
+    if type(x) is int:
+        return x
+    if x is None:
+        return 0
+    try:
+        return int(x)
+    except Exception:
+        return 0
+
+
+# epoch-second -> formatted string; ticks arrive in bursts within the same
+# second, so this is nearly always a dict hit. Kept tiny on purpose.
+_quote_date_memo = {}
+
+def _fast_quote_date(ts):
+    """Format a Schwab timestamp as 'YYYY-MM-DD HH:mm:ss' without arrow.
+
+    Schwab sends epoch millis (sometimes seconds) or ISO8601 strings; both
+    have cheap specialized paths. Anything else falls back to arrow.
+    """
+    if isinstance(ts, (int, float)):
+        sec = int(ts / 1000) if ts > 1e11 else int(ts)
+        out = _quote_date_memo.get(sec)
+        if out is None:
+            out = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(sec))
+            if len(_quote_date_memo) > 8:
+                _quote_date_memo.clear()
+            _quote_date_memo[sec] = out
+        return out
+    if isinstance(ts, str) and len(ts) >= 19 and ts[4] == "-" and ts[7] == "-":
+        return ts[:10] + " " + ts[11:19]
+    return arrow.get(ts).format("YYYY-MM-DD HH:mm:ss")
+
+
 class SchwabCallbackQuoteAdapter(QuoteAdapter):
     """
     Pull-based QuoteAdapter for PaperBroker + push-based callback receiver for Schwab stream.
@@ -43,9 +98,14 @@ class SchwabCallbackQuoteAdapter(QuoteAdapter):
     """
     
     def __init__(self):
-        self._lock = threading.RLock()
+        # writer-side lock only: on_market_data serializes against itself.
+        # Readers (get_quote/get_options) run lock-free — quotes are immutable
+        # once published and CPython dict get/insert are atomic under the GIL,
+        # so readers always see either the previous or the new quote.
+        self._lock = threading.Lock()
         self._equity_quotes = {}   # symbol -> Quote
         self._option_quotes = {}   # normalized option symbol -> OptionQuote
+        self._options_by_underlying = {}  # underlying symbol -> {option symbol -> OptionQuote}
         self._other_quotes = {}    # other quotes
         self._last_ts = {}         # symbol -> timestamp (as provided)
         self._raw_cache = {}       # symbol -> dict
@@ -60,7 +120,7 @@ class SchwabCallbackQuoteAdapter(QuoteAdapter):
         if not service.startswith("LEVELONE"):
             return
         
-        sym_key = str(raw_symbol).upper()
+        sym_key = sys.intern(str(raw_symbol).upper())
 
         # --- Sticky-field merge: keep last values unless we get new ones ---
         with self._lock:
@@ -80,12 +140,6 @@ class SchwabCallbackQuoteAdapter(QuoteAdapter):
         # from here on, use merged as *the* payload
         data = merged
         
-        def _num(x):
-            try:
-                return float(x) if x is not None else None
-            except Exception:
-                return None
-    
         bid = _num(data.get("Bid Price") or data.get("Bid"))
         ask = _num(data.get("Ask Price") or data.get("Ask"))
         last = _num(data.get("Last Price") or data.get("Last"))
@@ -93,12 +147,8 @@ class SchwabCallbackQuoteAdapter(QuoteAdapter):
     
         price = mark if mark is not None else last
     
-        bid_size = data.get("Bid Size")
-        ask_size = data.get("Ask Size")
-        try: bid_size = int(bid_size) if bid_size is not None else 0
-        except Exception: bid_size = 0
-        try: ask_size = int(ask_size) if ask_size is not None else 0
-        except Exception: ask_size = 0
+        bid_size = _size(data.get("Bid Size"))
+        ask_size = _size(data.get("Ask Size"))
     
         underlying_price = _num(
             data.get("Underlying Price") or data.get("Underlying") or data.get("UnderlyingPrice")
@@ -116,7 +166,7 @@ class SchwabCallbackQuoteAdapter(QuoteAdapter):
         strike = _num(data.get("Strike Price") or data.get("Strike"))
         contract_type = data.get("Contract Type")  # if present
     
-        quote_date = arrow.get(data["timestamp"]).format("YYYY-MM-DD HH:mm:ss")
+        quote_date = _fast_quote_date(data["timestamp"])
     
         q = quote_factory_from_service(
             service=service,
@@ -141,11 +191,14 @@ class SchwabCallbackQuoteAdapter(QuoteAdapter):
         except Exception:
             pass
     
-        sym = q.asset.symbol.upper()  # canonical normalized symbol from asset_factory(service=...)
+        # canonical symbol from asset_factory(service=...); Asset.__init__
+        # already upper-cased and interned it, so no per-tick copy here
+        sym = q.asset.symbol
         with self._lock:
             qt = getattr(q, "quote_type", None)
             if qt == "option":
                 self._option_quotes[sym] = q
+                self._options_by_underlying.setdefault(q.asset.underlying.symbol, {})[sym] = q
             elif qt == "equity":
                 self._equity_quotes[sym] = q
             else:
@@ -156,27 +209,28 @@ class SchwabCallbackQuoteAdapter(QuoteAdapter):
     # --- QuoteAdapter contract ---
 
     def get_quote(self, asset):
-        sym = asset_factory(asset).symbol.upper()
-        with self._lock:
-            return self._option_quotes.get(sym) or self._equity_quotes.get(sym) or self._other_quotes.get(sym)
+        sym = asset_factory(asset).symbol
+        # lock-free read; see __init__ for why this is safe
+        return self._option_quotes.get(sym) or self._equity_quotes.get(sym) or self._other_quotes.get(sym)
 
     def get_options(self, underlying_asset=None, expiration_date=None):
-        with self._lock:
+        # lock-free snapshots; list() iterates atomically under the GIL.
+        # Chain queries walk only the per-underlying index instead of
+        # copying the whole option cache.
+        if underlying_asset is not None:
+            underlying = asset_factory(underlying_asset).symbol
+            opts = list(self._options_by_underlying.get(underlying, {}).values())
+        else:
             opts = list(self._option_quotes.values())
 
-        if underlying_asset is None and expiration_date is None:
+        if expiration_date is None:
             return opts
 
-        underlying = asset_factory(underlying_asset).symbol.upper() if underlying_asset else None
-        exp = arrow.get(expiration_date).format("YYYY-MM-DD") if expiration_date else None
-
+        exp = arrow.get(expiration_date).format("YYYY-MM-DD")
         out = []
         for oq in opts:
             try:
-                opt = oq.asset
-                if underlying and opt.underlying.symbol.upper() != underlying:
-                    continue
-                if exp and opt.expiration_date != exp:
+                if oq.asset.expiration_date != exp:
                     continue
                 out.append(oq)
             except Exception:
@@ -9,11 +9,52 @@
 """
 import arrow
 import re
+import sys
+from datetime import date
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=4096)
+def _date_ordinal(day: str) -> int:
+    # fixed-format 'YYYY-MM-DD' -> proleptic ordinal; fromisoformat is far
+    # cheaper than arrow and the cache makes repeats a dict hit
+    return date.fromisoformat(day).toordinal()
+
+
+def _as_of_ordinal(as_of) -> int:
+    # ordinal to subtract from an expiration ordinal for DTE. Must match
+    # (arrow.get(exp) - arrow.get(as_of)).days exactly: timedelta.days
+    # floors, so an as-of partway through a day counts that day as elapsed
+    if isinstance(as_of, str) and len(as_of) >= 10 and as_of[4] == '-' and as_of[7] == '-':
+        ordinal = _date_ordinal(as_of[:10])
+        # 'YYYY-MM-DD HH:mm:ss': any nonzero digit in the time slice means a
+        # non-midnight as-of, which the old timedelta floored down one day
+        for c in as_of[11:19]:
+            if '1' <= c <= '9':
+                return ordinal + 1
+        return ordinal
+    t = arrow.get(as_of)
+    ordinal = t.date().toordinal()
+    if t.hour or t.minute or t.second or t.microsecond:
+        ordinal += 1
+    return ordinal
+
+
+# OCC symbol layout: underlying + YYMMDD + C/P + strike*1000 zero-padded to 8
+_OCC_RE = re.compile(r"^([A-Z0-9\.\-]+?)(\d{6})([CP])(\d{8})$")
+
+
 def _norm_symbol(symbol: str) -> str:
-    return re.sub(r"\s+", "", str(symbol).strip().upper())
+    # intern: the same few hundred symbols recur millions of times in a
+    # streaming feed, so dict keys built from them compare by pointer.
+    # Most tick symbols are already canonical (upper-case, no whitespace);
+    # detect that and skip the regex/strip/upper passes entirely. isprintable
+    # rejects tabs/newlines/NBSP (isupper alone passes 'AAL\n'), and the
+    # space - the one printable whitespace - is checked explicitly.
+    if type(symbol) is str and ' ' not in symbol and symbol.isupper() and symbol.isprintable():
+        return sys.intern(symbol)
+    return sys.intern(re.sub(r"\s+", "", str(symbol).strip().upper()))
 
 def asset_factory(symbol=None, service: Optional[str] = None):
     """
@@ -27,8 +68,14 @@ def asset_factory(symbol=None, service: Optional[str] = None):
     if isinstance(symbol, Asset):
         return symbol
 
-    sym = _norm_symbol(symbol)
-    svc = (service or "").upper()
+    # normalize here so the cache only ever sees canonical (interned) keys
+    return _asset_factory_cached(_norm_symbol(symbol), (service or "").upper())
+
+
+@lru_cache(maxsize=200_000)
+def _asset_factory_cached(sym: str, svc: str):
+    # streaming feeds re-parse the same ~N symbols per tick; memoizing turns
+    # the reverse/slice/date work into a single dict lookup
 
     # --- Service-aware routing (authoritative when present) ---
     if svc:
@@ -72,33 +119,40 @@ Asset: Assets are always identified by a symbol which uniquely identifies the as
 """
 class Asset():
 
+    __slots__ = ('symbol', 'asset_type')
+
     def __init__(self, symbol: str=None, asset_type: str=None):
-        self.symbol = symbol.upper()
-        self.asset_type = asset_type or 'asset'
+        self.symbol = sys.intern(symbol.upper())
+        self.asset_type = sys.intern(asset_type or 'asset')
         return
 
     def __eq__(self, other):
         """Override the default Equals behavior"""
-        if isinstance(other, self.__class__):
-            return self.symbol == other.symbol
-        if isinstance(other, str):
-            return self.symbol == other.upper()
-        return False
+        # symbols are interned, so for assets out of asset_factory's cache
+        # the identity check settles it without touching the characters
+        if isinstance(other, Asset):
+            o = other.symbol
+        elif isinstance(other, str):
+            o = other.upper()
+        else:
+            return False
+        return self.symbol is o or self.symbol == o
 
     def __ne__(self, other):
         """Define a non-equality test"""
         return not self.__eq__(other)
-    
+
     def __hash__(self):
-        # Must be consistent with __eq__.
-        # Include class so Equity("AAPL") and Asset("AAPL") don't collide,
-        # matching your __eq__ behavior (only equal within same class).
-        return hash((self.__class__, self.symbol))
+        # Must be consistent with __eq__, which compares by symbol alone;
+        # the symbol encodes the asset class, so there are no collisions
+        # between option and equity assets to worry about.
+        return hash(self.symbol)
 
 """
     Base class for any equities
 """
 class Equity(Asset):
+    __slots__ = ()
     def __init__(self, symbol: str):
         super().__init__(symbol, asset_type="equity")
 
@@ -107,19 +161,35 @@ class Equity(Asset):
 """
 class Option(Asset):
 
+    __slots__ = ('strike', 'option_type', 'expiration_date', 'underlying', '_exp_ordinal')
+
     def __init__(self, symbol:str = None, underlying=None, option_type:str = None, strike:float = None, expiration_date = None):
 
         if symbol is not None:
-            symbol = re.sub(r"\s+", "", str(symbol).strip().upper())
+            symbol = _norm_symbol(symbol)
 
             # if a symbol is provided, then we create the asset based on the symbol
-
-            r = symbol[::-1]
-
-            self.strike = float(r[0:8][::-1]) / 1000
-            self.option_type = 'call' if r[8] == 'C' else 'put'
-            self.expiration_date = arrow.get(r[9:15][::-1], 'YYMMDD').format('YYYY-MM-DD')
-            self.underlying = asset_factory(r[15:][::-1])
+            # the layout is fixed from the end, so slice directly instead of
+            # reversing the string; the precompiled regex validates in one pass
+
+            m = _OCC_RE.match(symbol)
+            if m is not None:
+                under, yymmdd, cp, strike = m.groups()
+                self.strike = int(strike) / 1000.0
+                self.option_type = 'call' if cp == 'C' else 'put'
+                self.underlying = asset_factory(under)
+            else:
+                # lenient fallback for symbols the strict regex rejects
+                under = symbol[:-15]
+                yymmdd = symbol[-15:-9]
+                self.strike = float(symbol[-8:]) / 1000
+                self.option_type = 'call' if symbol[-9] == 'C' else 'put'
+                self.underlying = asset_factory(under)
+
+            # YYMMDD -> YYYY-MM-DD by hand; arrow parsing is far too slow
+            # for the per-tick path and the format here is fixed
+            self.expiration_date = f"20{yymmdd[0:2]}-{yymmdd[2:4]}-{yymmdd[4:6]}"
+            self._exp_ordinal = _date_ordinal(self.expiration_date)
 
         else:
 
@@ -151,7 +221,8 @@ class Option(Asset):
             self.underlying = underlying
             self.option_type = option_type
             self.strike = float(strike)
-            self.expiration_date = arrow.get(expiration_date, 'YYMMDD').format('YYYY-MM-DD')
+            self.expiration_date = f"20{expiration_date[0:2]}-{expiration_date[2:4]}-{expiration_date[4:6]}"
+            self._exp_ordinal = _date_ordinal(self.expiration_date)
 
         super(Option, self).__init__(symbol, self.option_type)
 
@@ -174,15 +245,19 @@ class Option(Asset):
         return None
 
     def get_days_to_expiration(self, as_of_date):
-        return (arrow.get(self.expiration_date) - arrow.get(as_of_date)).days
+        # ordinal subtraction; called per-position per-tick so it must not
+        # round-trip through arrow
+        return self._exp_ordinal - _as_of_ordinal(as_of_date)
 
 
 class Put(Option):
+    __slots__ = ()
     def __init__(self, symbol: str = None, underlying = None,
                  underlying_symbol: str = None, strike: float = None, expiration_date=None):
         super(Put, self).__init__(symbol=symbol, option_type='put', underlying = underlying, strike=strike, expiration_date=expiration_date)
 
 class Call(Option):
+    __slots__ = ()
     def __init__(self, symbol: str = None, underlying = None,
                  underlying_symbol: str = None, strike: float = None, expiration_date=None):
         super(Call, self).__init__(symbol=symbol, option_type='call', underlying = underlying, strike=strike, expiration_date=expiration_date)
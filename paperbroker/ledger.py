@@ -13,15 +13,16 @@ Discription
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, asdict
-from typing import Optional, Any, List, TYPE_CHECKING
+from typing import ClassVar, Optional, Any, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Only for type hints; avoids import cycles at runtime
     from .accounts import Account
 
 
-@dataclass
+@dataclass(slots=True)
 class LedgerEntry:
     """
     One execution record (typically one filled leg of an order).
@@ -68,10 +69,31 @@ class LedgerEntry:
     trade_cash: float = 0.0              # cash change excluding fees (execution only)
     net_cash: float = 0.0                # cash change including fees (trade_cash - fees_total)
 
+    # freelist of recycled entries (ClassVar, so not a dataclass field);
+    # only useful to callers that trim their ledger, see release()
+    _pool: ClassVar[deque] = deque(maxlen=4096)
+
     def to_dict(self) -> dict:
         """Convenience for turning entries into dicts (for DataFrames, CSV, etc.)."""
         return asdict(self)
 
+    @classmethod
+    def acquire(cls, *args, **kwargs) -> "LedgerEntry":
+        """Like LedgerEntry(...), but reuses a released instance when one is pooled."""
+        if cls._pool:
+            entry = cls._pool.pop()
+            entry.__init__(*args, **kwargs)
+            return entry
+        return cls(*args, **kwargs)
+
+    def release(self) -> None:
+        """
+        Return this entry to the pool. The ledger itself never discards
+        entries, so this is for callers that export and then trim a rolling
+        window; released entries must no longer be referenced.
+        """
+        type(self)._pool.append(self)
+
 
 def ensure_ledger(account: Account) -> None:
     """
@@ -93,24 +115,23 @@ def record_ledger_entry(account: Account, entry: LedgerEntry) -> None:
 def export_ledger_to_csv(account: Account, filepath: str) -> None:
     """
     Export the account's ledger to a CSV file (simple flat format).
+
+    Writes rows straight from entry attributes with csv.writer; going
+    through asdict/DictWriter deep-copies every entry and re-hashes the
+    field names per row, which dominates on multi-million-entry ledgers.
     """
     import csv
+    from dataclasses import fields
 
     ensure_ledger(account)
-    rows: List[dict] = [e.to_dict() for e in account.ledger]  # type: ignore[attr-defined]
-    if not rows:
-        # Nothing to write; create an empty file with just a header
-        fieldnames = [f.name for f in LedgerEntry.__dataclass_fields__.values()]
-        with open(filepath, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-        return
-
-    fieldnames = list(rows[0].keys())
+    fieldnames = [f.name for f in fields(LedgerEntry)]
     with open(filepath, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (getattr(e, name) for name in fieldnames)
+            for e in account.ledger  # type: ignore[attr-defined]
+        )
 
 
 def ledger_to_dicts(account: Account) -> List[dict]:
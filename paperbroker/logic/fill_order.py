@@ -16,6 +16,27 @@ from ..estimators import Estimator
 from math import copysign
 from .maintenance_margin import get_maintenance_margin
 
+# numba is optional, same graceful degradation as ivolat3/numpy elsewhere;
+# when present the per-leg cash kernel runs compiled
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _leg_cash_delta(cost_basis: float, abs_quantity: float, sign: float, multiplier: float) -> float:
+    # arithmetic core of a leg fill, kept free of object access so numba
+    # can compile it; returns the amount to subtract from account.cash
+    return abs(cost_basis) * abs_quantity * sign * multiplier
+
+if njit is not None:
+    # explicit signature forces eager compilation at import, and cache=True
+    # persists the compiled kernel to __pycache__ so only the first import
+    # after a redeploy ever pays the JIT cost
+    _leg_cash_delta = njit("float64(float64, float64, float64, float64)",
+                           cache=True)(_leg_cash_delta)
+
+
 def _cash_delta_for_leg(cost_basis: float, quantity: int, is_option: bool) -> float:
     """
     Returns cash delta (positive increases cash, negative spends cash).
@@ -25,6 +46,40 @@ def _cash_delta_for_leg(cost_basis: float, quantity: int, is_option: bool) -> fl
     # replicate your existing cash-impact sign convention :contentReference[oaicite:4]{index=4}
     return -abs(cost_basis * quantity) * copysign(1, quantity) * mult
 
+def _validate_legs(order: Order, leg_prices: dict, positions_by_symbol: dict) -> None:
+    """
+    Check every leg's sign invariants and closable quantity up front, before
+    any account state is touched, so a rejected order leaves no partial fill.
+    """
+    for leg in order.legs:
+        cost_basis = leg_prices[leg]
+
+        if leg.order_type[0].lower() == 'b' and (leg.quantity < 0 or cost_basis < 0):
+            raise Exception(
+                "logic.fill_order: BTO or BTC legs must be positive quantity and positive price")
+
+        if leg.order_type[0].lower() == 's' and (leg.quantity > 0 or cost_basis > 0):
+            raise Exception(
+                "logic.fill_order: STO or STC legs must be negative quantity and negative price")
+
+        if leg.order_type.lower() in ('btc', 'stc'):
+            sign = 1 if leg.quantity >= 0 else -1
+            available = 0
+            found = False
+            for position in positions_by_symbol.get(leg.asset.symbol, ()):
+                if copysign(1, position.quantity) == -sign:
+                    found = True
+                    available += abs(position.quantity)
+                    if available >= abs(leg.quantity):
+                        break
+
+            if not found:
+                raise Exception("logic.fill_order: There are no available positions to close.")
+
+            if available < abs(leg.quantity):
+                raise Exception("logic.fill_order: There are not enough open positions to close.")
+
+
 def fill_order(account: Account = None, order: Order = None, quote_adapter:QuoteAdapter=None, estimator:Estimator=None):
     if account is None:
         raise Exception("logic.fill_order: must provide an account.")
@@ -39,13 +94,18 @@ def fill_order(account: Account = None, order: Order = None, quote_adapter:Quote
         estimator = Estimator()
 
     # figure out the best expected price the order would fill at
+    # fetch each leg's quote exactly once; get_quote takes the adapter lock,
+    # so repeated calls per leg contend with the streaming thread
+    leg_quotes = {}
     leg_prices = {}
     order_price = 0.0
     filled = False
 
     for leg in order.legs:
+        quote = quote_adapter.get_quote(leg.asset)
+        leg_quotes[leg] = quote
         # signed per-unit price (sell legs negative, buy legs positive)
-        px = estimator.estimate(quote_adapter.get_quote(leg.asset), quantity=leg.quantity)
+        px = estimator.estimate(quote, quantity=leg.quantity)
         px = px * copysign(1, leg.quantity)
         leg_prices[leg] = px
         order_price += px * abs(leg.quantity)   #cost of order: how much this order would cost now in the market
@@ -68,8 +128,7 @@ def fill_order(account: Account = None, order: Order = None, quote_adapter:Quote
         # compute "current quote time" as max quote_date over legs
         now_ts = None
         for leg in order.legs:
-            q = quote_adapter.get_quote(leg.asset)
-            ts = getattr(q, "quote_date", None)
+            ts = getattr(leg_quotes[leg], "quote_date", None)
             if ts is not None and (now_ts is None or ts > now_ts):
                 now_ts = ts
 
@@ -89,7 +148,7 @@ def fill_order(account: Account = None, order: Order = None, quote_adapter:Quote
             projected_delta += _cash_delta_for_leg(
                 cost_basis=cost_basis,
                 quantity=leg.quantity,
-                is_option=isinstance(leg.asset, Option),
+                is_option=leg.asset.asset_type in ('call', 'put'),
             )
 
         cash_before_all = float(getattr(account, "cash", 0.0))
@@ -101,40 +160,49 @@ def fill_order(account: Account = None, order: Order = None, quote_adapter:Quote
             setattr(order, "reject_reason", f"insufficient_funds cash={cash_before_all:.2f} delta={projected_delta:.2f}")
             return account
 
+        # index positions by symbol once; per-leg scans below become
+        # O(positions on that symbol) instead of O(all positions)
+        positions_by_symbol = account._rebuild_positions_index()
+
+        # validate all legs before mutating anything; the equivalent in-loop
+        # checks below are debug-only re-assertions elided under python -O
+        _validate_legs(order, leg_prices, positions_by_symbol)
+
         for leg in order.legs:
-            
+
             # Pre-fill state for ledger
             cash_before = account.cash
             # position_qty_before = sum of matching positions
-            position_qty_before = sum(p.quantity for p in account.positions if p.asset == leg.asset)
+            position_qty_before = sum(p.quantity for p in positions_by_symbol.get(leg.asset.symbol, ()))
             # Snapshot quote once (for both pricing and ledger)
-            quote = quote_adapter.get_quote(leg.asset)
+            quote = leg_quotes[leg]
 
             cost_basis = leg_prices[leg]
 
-            if leg.order_type[0].lower() == 'b' and (leg.quantity < 0 or cost_basis < 0):
-                raise Exception(
-                    "logic.fill_order: BTO or BTC legs must be positive quantity and positive price")
+            # hoisted per-leg constants: Option.__init__ always sets
+            # asset_type to 'call'/'put', so the string check replaces the
+            # repeated isinstance, and sign replaces copysign(1, quantity)
+            sign = 1 if leg.quantity >= 0 else -1
+            abs_quantity = abs(leg.quantity)
+            is_option = leg.asset.asset_type in ('call', 'put')
+            multiplier = 100 if is_option else 1
+
+            if __debug__:
+                if leg.order_type[0].lower() == 'b' and (leg.quantity < 0 or cost_basis < 0):
+                    raise Exception(
+                        "logic.fill_order: BTO or BTC legs must be positive quantity and positive price")
+
+                if leg.order_type[0].lower() == 's' and (leg.quantity > 0 or cost_basis > 0):
+                    raise Exception(
+                        "logic.fill_order: STO or STC legs must be negative quantity and negative price")
 
-            if leg.order_type[0].lower() == 's' and (leg.quantity > 0 or cost_basis > 0):
-                raise Exception(
-                    "logic.fill_order: STO or STC legs must be negative quantity and negative price")
-            
             # Cash impact
-            if isinstance(leg.asset, Option):
-                account.cash -= abs(cost_basis * leg.quantity) * copysign(1, leg.quantity) * 100
-                multiplier = 100
-            else:
-                account.cash -= abs(cost_basis * leg.quantity) * copysign(1, leg.quantity)
-                multiplier = 1
-            
+            account.cash -= _leg_cash_delta(cost_basis, abs_quantity, sign, multiplier)
+
             # ---- Fees / commissions (modeled per asset type)
             # Example: options commission $0.65 per contract; equities $0.00
-            commission = 0.0
-            fees = 0.0
-            if isinstance(leg.asset, Option):
-                commission = 0.65 * abs(leg.quantity)
-                fees = 0.01 * abs(leg.quantity)
+            commission = 0.65 * abs_quantity if is_option else 0.0
+            fees = 0.01 * abs_quantity if is_option else 0.0
             
             cash_after_trade = account.cash  # after execution cash impact, before fees
             fees_total = float(commission) + float(fees)
@@ -146,26 +214,34 @@ def fill_order(account: Account = None, order: Order = None, quote_adapter:Quote
             # if the leg is opening, then create a position for each leg
             if leg.order_type.lower() in ['bto', 'sto']:
 
-                account.positions.append(Position(leg.asset, leg.quantity, cost_basis, quote=quote_adapter.get_quote(leg.asset)))
+                opened = Position.acquire(leg.asset, leg.quantity, cost_basis, quote=quote)
+                account.positions.append(opened)
+                positions_by_symbol.setdefault(opened.asset.symbol, []).append(opened)
                 # Opening trades do not realize P&L
                 realized_pnl_for_this_leg = None
 
             elif leg.order_type.lower() in ['btc', 'stc']:
 
-                closable_positions = [position for position in account.positions if
-                                      position.asset == leg.asset and copysign(1, position.quantity) == (copysign(1, leg.quantity) * -1)]
-
-                if len(closable_positions) == 0:
-                    raise Exception("logic.fill_order: There are no available positions to close.")
+                # collect closable positions and tally availability in one
+                # pass, stopping as soon as enough quantity is found
+                closable_positions = []
+                quantity_available_to_close = 0
+                for position in positions_by_symbol.get(leg.asset.symbol, ()):
+                    if copysign(1, position.quantity) == -sign:
+                        closable_positions.append(position)
+                        quantity_available_to_close += abs(position.quantity)
+                        if quantity_available_to_close >= abs_quantity:
+                            break
 
-                # add up the quantities available
-                quantity_available_to_close = sum([position.quantity for position in closable_positions])
+                if __debug__:
+                    if len(closable_positions) == 0:
+                        raise Exception("logic.fill_order: There are no available positions to close.")
 
-                if abs(quantity_available_to_close) < abs(leg.quantity):
-                    raise Exception("logic.fill_order: There are not enough open positions to close.")
+                    if quantity_available_to_close < abs_quantity:
+                        raise Exception("logic.fill_order: There are not enough open positions to close.")
 
                 # iterate through the positions and reduce the quantity by the leg quantity
-                quantity_to_close_remaining = abs(leg.quantity)
+                quantity_to_close_remaining = abs_quantity
                 for position in closable_positions:
                     if quantity_to_close_remaining > 0:
                         quantity_can_close = abs(position.quantity)
@@ -177,14 +253,13 @@ def fill_order(account: Account = None, order: Order = None, quote_adapter:Quote
             cash_after = account.cash
             trade_cash = cash_after_trade - cash_before
             net_cash = cash_after - cash_before
-            position_qty_after = sum(p.quantity for p in account.positions if p.asset == leg.asset)
+            position_qty_after = sum(p.quantity for p in positions_by_symbol.get(leg.asset.symbol, ()))
             gross_cash = net_cash
             
             # Timestamp from quote or fallback
-            quote = quote_adapter.get_quote(leg.asset)
             timestamp = quote.quote_date if quote and hasattr(quote, "quote_date") else datetime.utcnow()
             
-            entry = LedgerEntry(
+            entry = LedgerEntry.acquire(
                 timestamp = timestamp,
                 account_id = account.account_id,
                 order_id = order.order_id,
@@ -212,9 +287,20 @@ def fill_order(account: Account = None, order: Order = None, quote_adapter:Quote
             record_ledger_entry(account, entry)
         filled = True
 
-    # filter out any positions that are completely closed
-    
-    account.positions = [position for position in account.positions if position.quantity != 0]
+    # filter out any positions that are completely closed,
+    # rebuilding list and index in a single pass
+
+    open_positions = []
+    positions_by_symbol = {}
+    for position in account.positions:
+        if position.quantity != 0:
+            open_positions.append(position)
+            positions_by_symbol.setdefault(position.asset.symbol, []).append(position)
+        else:
+            # fully closed and about to be dropped: recycle it
+            position.release()
+    account.positions = open_positions
+    account._positions_by_symbol = positions_by_symbol
     account.maintenance_margin = get_maintenance_margin(positions=account.positions, quote_adapter=quote_adapter)
     
     if filled:
@@ -10,6 +10,25 @@ try:
 except ImportError:
     ivolat3 = None
 
+def get_option_greeks_batch(option_types, strikes, underlying_prices, days_to_expirations, prices, risk_free_rate=0.02, dividend=0.0):
+    """
+    Greeks for aligned sequences of option inputs (one chain snapshot) in a
+    single pass. Deliberately shares the scalar ivolat3 engine below so batch
+    and per-quote results are always identical; the win is skipping per-call
+    setup when ivolat3 is missing and amortizing dispatch over the chain.
+    """
+    if ivolat3 is None:
+        blank = get_option_greeks(None, None, None, None, None)
+        return [dict(blank) for _ in option_types]
+
+    return [
+        get_option_greeks(option_type, strike, underlying_price, days_to_expiration, price,
+                          risk_free_rate=risk_free_rate, dividend=dividend)
+        for option_type, strike, underlying_price, days_to_expiration, price
+        in zip(option_types, strikes, underlying_prices, days_to_expirations, prices)
+    ]
+
+
 def get_option_greeks(option_type, strike, underlying_price, days_to_expiration, price, risk_free_rate=0.02, dividend = 0.0):
 
     out = {
@@ -12,6 +12,61 @@ from ..assets import Asset, Option, Call, Put
 from ..adapters.quotes.QuoteAdapter import QuoteAdapter
 from .group_into_basic_strategies import *
 
+# NumPy is optional; portfolios with many naked options batch their margin
+# arithmetic through it, everything else degrades to the scalar loop.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _naked_option_margin(strategies, quote_adapter):
+    """
+    Margin for a batch of naked short puts/calls. Gathers prices into flat
+    arrays and computes the per-share margin in one vectorized expression;
+    with NumPy unavailable (or a small batch) it loops per strategy.
+    """
+    option_prices = []
+    underlying_prices = []
+    strikes = []
+    contracts = []
+    is_put = []
+
+    for strategy in strategies:
+        option_asset = strategy.asset
+        option_quote = quote_adapter.get_quote(option_asset)
+        underlying_quote = quote_adapter.get_quote(option_asset.underlying)
+
+        if option_quote is None or underlying_quote is None \
+           or option_quote.price is None or underlying_quote.price is None:
+            raise Exception("Cannot compute margin for naked {}: missing quote data".format(option_asset.option_type))
+
+        option_prices.append(abs(option_quote.price))
+        underlying_prices.append(underlying_quote.price)
+        strikes.append(option_asset.strike)
+        contracts.append(abs(strategy.quantity))
+        is_put.append(option_asset.option_type == 'put')
+
+    if numpy is not None and len(strategies) > 1:
+        p = numpy.asarray(option_prices)
+        s = numpy.asarray(underlying_prices)
+        k = numpy.asarray(strikes)
+        n = numpy.asarray(contracts)
+        put = numpy.asarray(is_put)
+
+        # puts are OTM by S-K, calls by K-S; the 10% floor is on the strike
+        # for puts and on the underlying for calls
+        otm = numpy.maximum(0.0, numpy.where(put, s - k, k - s))
+        floor = numpy.where(put, 0.10 * k, 0.10 * s)
+        per_share = p + numpy.maximum(0.20 * s - otm, floor)
+        return float((per_share * 100 * n).sum())
+
+    total = 0.0
+    for p, s, k, n, put in zip(option_prices, underlying_prices, strikes, contracts, is_put):
+        otm = max(0.0, (s - k) if put else (k - s))
+        floor = 0.10 * k if put else 0.10 * s
+        total += (p + max(0.20 * s - otm, floor)) * 100 * n
+    return total
 
 
 def get_maintenance_margin(strategies=None, positions=None, quote_adapter:QuoteAdapter=None):
@@ -22,7 +77,22 @@ def get_maintenance_margin(strategies=None, positions=None, quote_adapter:QuoteA
     #start the calculation off
     total_margin_requirement = 0.0
 
+    # partition once: naked short options batch their arithmetic, everything
+    # else goes through the per-strategy branches below
+    naked_options = []
+    remaining = []
     for strategy in strategies:
+        if strategy.strategy_type == 'asset' \
+                and strategy.direction == 'short' \
+                and isinstance(strategy.asset, (Put, Call)):
+            naked_options.append(strategy)
+        else:
+            remaining.append(strategy)
+
+    if naked_options:
+        total_margin_requirement += _naked_option_margin(naked_options, quote_adapter)
+
+    for strategy in remaining:
 
         if strategy.strategy_type == 'asset' \
                 and strategy.direction == 'long':
@@ -63,62 +133,6 @@ def get_maintenance_margin(strategies=None, positions=None, quote_adapter:QuoteA
             # credit call spreads use the width of the strikes
             total_margin_requirement += (strategy.buy_option.strike - strategy.sell_option.strike) * 100
 
-        elif strategy.strategy_type == 'asset' \
-                and strategy.direction=='short' \
-                and isinstance(strategy.asset, Put):
-            # Naked short put margin
-            put_asset = strategy.asset
-            contracts = abs(strategy.quantity)
-
-            put_quote = quote_adapter.get_quote(put_asset)
-            underlying_quote = quote_adapter.get_quote(put_asset.underlying)
-
-            if put_quote is None or underlying_quote is None \
-               or put_quote.price is None or underlying_quote.price is None:
-                raise Exception("Cannot compute margin for naked put: missing quote data")
-
-            option_price = abs(put_quote.price)
-            underlying_price = underlying_quote.price
-            strike = put_asset.strike
-
-            # Amount out of the money for a put: max(0, S - K)
-            otm = max(0.0, underlying_price - strike)
-
-            per_share_margin = option_price + max(
-                0.20 * underlying_price - otm,
-                0.10 * strike
-            )
-
-            total_margin_requirement += per_share_margin * 100 * contracts
-
-        elif strategy.strategy_type == 'asset' \
-                and strategy.direction=='short' \
-                and isinstance(strategy.asset, Call):
-            # Naked short call margin
-            call_asset = strategy.asset
-            contracts = abs(strategy.quantity)
-
-            call_quote = quote_adapter.get_quote(call_asset)
-            underlying_quote = quote_adapter.get_quote(call_asset.underlying)
-
-            if call_quote is None or underlying_quote is None \
-               or call_quote.price is None or underlying_quote.price is None:
-                raise Exception("Cannot compute margin for naked call: missing quote data")
-
-            option_price = abs(call_quote.price)
-            underlying_price = underlying_quote.price
-            strike = call_asset.strike
-
-            # Amount out of the money for a call: max(0, K - S)
-            otm = max(0.0, strike - underlying_price)
-
-            per_share_margin = option_price + max(
-                0.20 * underlying_price - otm,
-                0.10 * underlying_price
-            )
-
-            total_margin_requirement += per_share_margin * 100 * contracts
-
         else:
             raise Exception('A strategy was provided that we do not know how to calculate the maintenance margin for')
 
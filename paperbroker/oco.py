@@ -9,16 +9,28 @@ Modified: %(dates)s
 Discription
 ------------
 """
-import numpy as np
-import matplotlib.pyplot as plt
-import scipy as sci
-
 from dataclasses import dataclass
 from typing import List, Optional
 from .orders import Order
 from .logic.fill_order import fill_order  # adjust import to match your layout
 
-@dataclass
+# numpy is optional, same graceful degradation as ivolat3 elsewhere; with it
+# the OCOBook trigger scan runs as a few ufunc passes over the whole book
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# OCOBook side / status codes. Small ints rather than strings so the columns
+# pack into int8/uint8 arrays and compare branchlessly.
+SIDE_BUY = 1
+SIDE_SELL = -1
+
+STATUS_OPEN = 0
+STATUS_FILLED = 1
+STATUS_CANCELED = 2
+
+@dataclass(slots=True)
 class OCOGroup:
     orders: List[Order]
     oco_id: Optional[str] = None
@@ -33,17 +45,18 @@ class OCOGroup:
         if not self.is_active:
             return True
 
-        for o in self.orders:
-            if o.status != "open":
-                continue
+        # snapshot the open orders once; on a fill, siblings are canceled by
+        # index so the cancel pass never re-tests identity or status
+        open_orders = [o for o in self.orders if o.status == "open"]
 
+        for idx, o in enumerate(open_orders):
             # Use your existing fill_order logic
             fill_order(account=account, order=o, quote_adapter=quote_adapter, estimator=estimator)
 
             if o.status == "filled":
                 # cancel all other open siblings
-                for other in self.orders:
-                    if other is not o and other.status == "open":
+                for j, other in enumerate(open_orders):
+                    if j != idx and other.status == "open":
                         other.status = "canceled"
                 self.is_active = False
                 return True
@@ -51,3 +64,133 @@ class OCOGroup:
         # still active (none filled yet)
         return False
 
+
+class OCOBook(object):
+    """
+    Column-oriented book of OCO child orders.
+
+    Where a list of OCOGroups walks every group and order in Python per tick,
+    the book keeps one row per open child order as parallel columns
+    (group id, order id, symbol, trigger price, side, status), so "should
+    anything fire?" against a QuoteTable snapshot is a handful of array
+    comparisons over the whole book, and canceling the losing siblings of
+    every triggered group is a single masked write.
+    """
+
+    __slots__ = ('group_ids', 'order_ids', 'symbols', 'trigger_prices',
+                 'sides', 'status', '_columns')
+
+    def __init__(self):
+        self.group_ids = []
+        self.order_ids = []
+        self.symbols = []
+        self.trigger_prices = []
+        self.sides = []
+        # bytearray so the scalar path mutates in place and the numpy path
+        # gets a writable zero-copy uint8 view via frombuffer
+        self.status = bytearray()
+        self._columns = None
+
+    def __len__(self):
+        return len(self.group_ids)
+
+    def add(self, group_id: int, order_id: int, symbol: str, trigger_price: float, side: int):
+        """Append one child order row; side is SIDE_BUY or SIDE_SELL."""
+        if side != SIDE_BUY and side != SIDE_SELL:
+            raise Exception("OCOBook.add: side must be SIDE_BUY or SIDE_SELL")
+        self.group_ids.append(int(group_id))
+        self.order_ids.append(int(order_id))
+        self.symbols.append(symbol)
+        self.trigger_prices.append(float(trigger_price))
+        self.sides.append(side)
+        self.status.append(STATUS_OPEN)
+        self._columns = None
+        return len(self.group_ids) - 1
+
+    def _immutable_columns(self):
+        # group/order/trigger/side never change after add, so the array forms
+        # are built once and reused until the next add invalidates them
+        if self._columns is None:
+            self._columns = (
+                numpy.asarray(self.group_ids, dtype=numpy.int32),
+                numpy.asarray(self.order_ids, dtype=numpy.int32),
+                numpy.asarray(self.trigger_prices, dtype=numpy.float64),
+                numpy.asarray(self.sides, dtype=numpy.int8),
+            )
+        return self._columns
+
+    def evaluate(self, quote_table):
+        """
+        Run every open row against a QuoteTable snapshot. Buy rows fire when
+        the ask trades at or through the trigger, sell rows when the bid does.
+        The first firing row of each group wins, its open siblings are
+        canceled, and the (group_id, order_id) winners are returned.
+        """
+        n = len(self.group_ids)
+        if n == 0:
+            return []
+
+        # one gather pass: per-row bid/ask aligned with the book columns;
+        # rows with no quote in the snapshot stay NaN and can never fire
+        row_of = {asset.symbol: i for i, asset in enumerate(quote_table.assets)}
+        nan = float('nan')
+        table_bids = quote_table.bids
+        table_asks = quote_table.asks
+        bids = [nan] * n
+        asks = [nan] * n
+        for i, symbol in enumerate(self.symbols):
+            j = row_of.get(symbol)
+            if j is not None:
+                bids[i] = table_bids[j]
+                asks[i] = table_asks[j]
+
+        if numpy is not None:
+            group_ids, order_ids, triggers, sides = self._immutable_columns()
+            status = numpy.frombuffer(self.status, dtype=numpy.uint8)
+            bids = numpy.asarray(bids, dtype=numpy.float64)
+            asks = numpy.asarray(asks, dtype=numpy.float64)
+
+            hits = (status == STATUS_OPEN) & (
+                ((sides == SIDE_BUY) & (asks <= triggers)) |
+                ((sides == SIDE_SELL) & (bids >= triggers)))
+            hit_rows = numpy.nonzero(hits)[0]
+            if hit_rows.size == 0:
+                return []
+
+            # unique's return_index points at the first occurrence, so each
+            # group's winner is its lowest-index firing row
+            winner_groups, first = numpy.unique(group_ids[hit_rows], return_index=True)
+            winner_rows = hit_rows[first]
+            losers = numpy.isin(group_ids, winner_groups) & (status == STATUS_OPEN)
+            status[losers] = STATUS_CANCELED
+            status[winner_rows] = STATUS_FILLED
+            return [(int(group_ids[i]), int(order_ids[i])) for i in winner_rows]
+
+        # scalar fallback: same semantics, one pass to fire plus one to cancel
+        status = self.status
+        winners = []
+        won = set()
+        for i in range(n):
+            if status[i] != STATUS_OPEN:
+                continue
+            group_id = self.group_ids[i]
+            if group_id in won:
+                continue
+            if self.sides[i] == SIDE_BUY:
+                px = asks[i]
+                fired = px == px and px <= self.trigger_prices[i]
+            else:
+                px = bids[i]
+                fired = px == px and px >= self.trigger_prices[i]
+            if fired:
+                status[i] = STATUS_FILLED
+                won.add(group_id)
+                winners.append((group_id, self.order_ids[i]))
+
+        if won:
+            for i in range(n):
+                if status[i] == STATUS_OPEN and self.group_ids[i] in won:
+                    status[i] = STATUS_CANCELED
+
+        return winners
+
@@ -11,23 +11,28 @@ import itertools
 
 _order_counter = itertools.count(1)
 
+# buy legs are positive, sell legs negative; table lookup beats branching
+# when legs are constructed in bulk
+_SIGN = {'b': 1, 's': -1}
+
 class Leg(object):
+
+    __slots__ = ('asset', 'quantity', 'order_type', 'price')
+
     def __init__(self, asset: Asset, quantity: int, order_type: str, price: float = None):
 
         # automatically correct the signs of the quantity and price
         if not order_type:
             raise Exception("Leg: order_type is required")
-        
-        asset = asset_factory(asset)
+
+        if not isinstance(asset, Asset):
+            asset = asset_factory(asset)
         if asset is None:
             raise Exception("Leg: asset is required")
-            
-        if order_type[0] == 's':
-            quantity = abs(quantity) * -1
-            price = (abs(price) * -1) if price is not None else None
-        else:
-            quantity = abs(quantity) * 1
-            price = (abs(price) * 1) if price is not None else None
+
+        sign = _SIGN.get(order_type[0], 1)
+        quantity = abs(quantity) * sign
+        price = (abs(price) * sign) if price is not None else None
 
         self.asset = asset
         self.quantity = quantity
@@ -36,10 +41,21 @@ class Leg(object):
 
 
 class Order(object):
+
+    # the trailing slots are written lazily (add_leg batching flag, the
+    # fill-deferral timestamp and reject reason from fill_order), so they
+    # are declared here even though __init__ may not set them
+    __slots__ = ('order_id', 'legs', 'status', 'price', 'condition', 'trail',
+                 'trail_is_percent', 'trail_best', 'time_in_force',
+                 'trail_is_batched', '_pb_submit_ts', 'reject_reason',
+                 '_leg_assets')
+
     def __init__(self, legs = None, price=None, condition='market', trail = 0.0, trail_is_percent = False, trail_best=None, status='open', time_in_force='day'):
         self.order_id = f"PB-{next(_order_counter)}"
         self.legs = legs if legs is not None else []
-        self.status = 'open'
+        # mirrors self.legs for O(1) duplicate-asset checks in add_leg
+        self._leg_assets = {leg.asset for leg in self.legs}
+        self.status = status
         self.price = float(price) if price is not None else None
         self.condition = condition
         if condition == 'trailing_stop':
@@ -51,14 +67,18 @@ class Order(object):
         else:
             self.trail = 0
             self.trail_is_percent = False
-            self.trail_best = status
+            self.trail_best = trail_best
             self.time_in_force = time_in_force
         
 
     def duplicate(self, times=1):
+        times = int(times)
         if self.price is not None:
             self.price *= times
-        for leg in self.legs:
+        # bind legs locally; orders stay small so a tight scalar loop beats
+        # staging the quantities through an array
+        legs = self.legs
+        for leg in legs:
             leg.quantity *= times
         return self
 
@@ -72,6 +92,33 @@ class Order(object):
         return self.add_leg(asset=asset, quantity=quantity, price=price, order_type='stc')
 
 
+    def add_legs(self, legs):
+        """
+        Add several prepared Legs in one call. Duplicates are checked against
+        the asset set first and the list grows once via extend, instead of
+        paying the per-call add_leg overhead leg by leg.
+        """
+        legs = list(legs)
+        seen = set(self._leg_assets)
+        for leg in legs:
+            if leg.asset in seen:
+                raise Exception("Order.add_legs symbol {} already exists within this order".format(leg.asset.symbol))
+            seen.add(leg.asset)
+
+        self._leg_assets = seen
+        self.legs.extend(legs)
+        for leg in legs:
+            self.price = self.price + leg.price * abs(leg.quantity) if self.price is not None and leg.price is not None else None
+
+        # same once-per-order trail batching as add_leg: the first leg that
+        # lands on a dollar-trailed order scales the trail by its quantity
+        if legs and self.condition == 'trailing_stop' and (not self.trail_is_percent):
+            if not getattr(self, "trail_is_batched", False):
+                self.trail = abs(self.trail) * abs(legs[0].quantity)
+                self.trail_is_batched = True
+
+        return self
+
     def add_leg(self, leg: Leg = None, asset=None, quantity: int = None, order_type: str = None, price: float = None):
         if leg is None:
             if quantity is None or int(quantity) == 0:
@@ -85,22 +132,25 @@ class Order(object):
             if asset and isinstance(asset, Quote):
                 asset = asset.asset
     
-            asset = asset_factory(asset)
+            if not isinstance(asset, Asset):
+                asset = asset_factory(asset)
             if asset is None:
                 raise Exception("Order.add_leg: an asset is required")
     
-            if len([_.asset.symbol for _ in self.legs if _.asset == asset]) > 0:
+            if asset in self._leg_assets:
                 raise Exception("Order.addLeg symbol {} already exists within this order".format(asset.symbol))
-    
+
             quantity = int(quantity)
             self.legs.append(Leg(asset=asset, quantity=quantity, order_type=order_type, price=price))
+            self._leg_assets.add(asset)
             self.price = self.price + price * abs(quantity) if self.price is not None and price is not None else None
             added_qty = quantity
     
         else:
-            if len([_.asset.symbol for _ in self.legs if _.asset == leg.asset]) > 0:
+            if leg.asset in self._leg_assets:
                 raise Exception("Order.add_leg symbol {} already exists within this order".format(leg.asset.symbol))
             self.legs.append(leg)
+            self._leg_assets.add(leg.asset)
             self.price = self.price + leg.price * abs(leg.quantity) if self.price is not None and leg.price is not None else None
             added_qty = leg.quantity
     
@@ -5,7 +5,8 @@
 """
 
 from .quotes import Quote
-from .assets import asset_factory, Option
+from .assets import Asset, asset_factory, Option
+from collections import deque
 from math import copysign
 
 class Position(object):
@@ -21,15 +22,34 @@ class Position(object):
     so not in per asset amounts but in total dollar impact to cash.
     """
 
+    # freelist of recycled instances; long backtests open and close positions
+    # by the million, and reuse keeps that churn away from the allocator/GC
+    _pool = deque(maxlen=4096)
+
     def __init__(self, asset, quantity: int, cost_basis: float=0.0, quote=None, position_id=None, open_date=None):
         self.id = position_id or ('position' + str(id(self)))
         self.open_date = open_date
-        self.asset = asset_factory(asset)
+        self.asset = asset if isinstance(asset, Asset) else asset_factory(asset)
         self.quantity = quantity
         self.cost_basis = cost_basis
         self.quote = quote
         self.multiplier = 100 if isinstance(self.asset, Option) else 1
 
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        """Like Position(...), but reuses a released instance when one is pooled."""
+        if cls._pool:
+            position = cls._pool.pop()
+            position.__init__(*args, **kwargs)
+            return position
+        return cls(*args, **kwargs)
+
+    def release(self):
+        """Return a fully-closed position to the pool. Callers must drop their reference."""
+        self.asset = None
+        self.quote = None
+        type(self)._pool.append(self)
+
     @property
     def total_cost_basis(self):
         """
@@ -4,13 +4,64 @@
 
 """
 import arrow
-import math
-from .assets import asset_factory, Option
-from .logic.ivolat3_option_greeks import get_option_greeks
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from .assets import Asset, asset_factory, Option
+from .logic.ivolat3_option_greeks import get_option_greeks, get_option_greeks_batch
+
+# NumPy is optional here as elsewhere; QuoteTable packs its numeric columns
+# into float64 arrays when it is available and lists otherwise
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def _to_epoch_ns(quote_date):
+    """
+    Best-effort conversion of a quote_date (epoch number, ISO string,
+    datetime, or anything arrow accepts) to int nanoseconds since epoch.
+    Naive inputs are treated as UTC.
+    """
+    if isinstance(quote_date, (int, float)):
+        # magnitude heuristic: already ns, millis, or seconds
+        if quote_date > 1e17:
+            return int(quote_date)
+        if quote_date > 1e11:
+            return int(quote_date * 1e6)
+        return int(quote_date * 1e9)
+    if isinstance(quote_date, datetime):
+        if quote_date.tzinfo is None:
+            quote_date = quote_date.replace(tzinfo=timezone.utc)
+        return int(quote_date.timestamp() * 1e9)
+    if isinstance(quote_date, str):
+        try:
+            dt = datetime.fromisoformat(quote_date)
+        except ValueError:
+            dt = None
+        if dt is not None:
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return int(dt.timestamp() * 1e9)
+    return int(arrow.get(quote_date).float_timestamp * 1e9)
+
+
+# the six greeks OptionQuote carries, in slot order
+_GREEK_KEYS = ('delta', 'iv', 'gamma', 'vega', 'theta', 'rho')
+
+
+@lru_cache(maxsize=65536)
+def _cached_greeks(option_type, strike, spot_cents, days_to_expiration, price_cents):
+    # streaming updates mostly repeat the same prices tick-to-tick, so the
+    # implied-vol solve is memoized on cent-quantized inputs; callers must
+    # treat the returned dict as read-only
+    return get_option_greeks(option_type, strike, spot_cents / 100.0,
+                             days_to_expiration, price_cents / 100.0, dividend=0.0)
 
 
 def quote_factory(quote_date, asset, price=None, bid=0.0, ask=0.0, bid_size=0, ask_size=0, underlying_price=None):
-    asset = asset_factory(asset)
+    if not isinstance(asset, Asset):
+        asset = asset_factory(asset)
     if isinstance(asset, Option):
         return OptionQuote(quote_date, asset, price=price, bid=bid, ask=ask, bid_size=bid_size, ask_size=ask_size, underlying_price=underlying_price)
     else:
@@ -26,14 +77,14 @@ def quote_factory_from_service(
     delta=None, iv=None, gamma=None, vega=None, theta=None, rho=None,
     days_to_exp=None, intrensic=None, strike=None, contract_type=None,
 ):
-    svc = (service or "").upper()
-    
-    if svc == "LEVELONE_EQUITIES":
-        asset = asset_factory(symbol=symbol, service=svc)
-        return EquityQuote(quote_date, asset, price=price, bid=bid, ask=ask, bid_size=bid_size, ask_size=ask_size)
-    
-    if svc in ("LEVELONE_OPTIONS", "LEVELONE_FUTURE_OPTIONS"):
-        asset = asset_factory(symbol=symbol, service=svc)   # still creates the instrument object, but no longer decides “option vs not”
+    # single dict probe on the interned service name replaces the if/elif
+    # chain; this runs once per stream message
+    svc = sys.intern((service or "").upper())
+    quote_cls = _SERVICE_QUOTE_CLS.get(svc, Quote)
+
+    asset = asset_factory(symbol=symbol, service=svc)
+
+    if quote_cls is OptionQuote:
         return OptionQuote(
             quote_date, asset,
             price=price, bid=bid, ask=ask, bid_size=bid_size, ask_size=ask_size,
@@ -43,37 +94,127 @@ def quote_factory_from_service(
             contract_type=contract_type,
         )
 
-    # equities/futures/forex: for now all map to Quote
+    # equities/futures/forex: for now all map to Quote/EquityQuote
     # (later you can make FuturesQuote/ForexQuote subclasses if you want)
-    asset = asset_factory(symbol=symbol, service=svc)
-    return Quote(quote_date, asset, price=price, bid=bid, ask=ask, bid_size=bid_size, ask_size=ask_size)
+    return quote_cls(quote_date, asset, price=price, bid=bid, ask=ask, bid_size=bid_size, ask_size=ask_size)
+
+
+class QuoteTable(object):
+    """
+    Column-oriented snapshot of many quotes at once.
+
+    Holds bids/asks/sizes/prices as contiguous columns and materializes
+    Quote objects lazily on indexing, so ingesting a 100K-symbol snapshot
+    is one pass over the rows instead of 100K Quote constructions. Mid
+    prices for rows without one are filled vectorized when NumPy is
+    available.
+    """
+
+    __slots__ = ('quote_date', 'assets', 'bids', 'asks', 'bid_sizes', 'ask_sizes', 'prices')
+
+    def __init__(self, quote_date, assets, bids, asks, bid_sizes, ask_sizes, prices):
+        self.quote_date = quote_date
+        self.assets = assets
+        self.bids = bids
+        self.asks = asks
+        self.bid_sizes = bid_sizes
+        self.ask_sizes = ask_sizes
+        self.prices = prices
+
+    @classmethod
+    def from_service_rows(cls, quote_date, rows):
+        """
+        Build a table from (symbol, bid, ask, bid_size, ask_size, price)
+        tuples; missing prices are NaN until the mid-price fill below.
+        """
+        assets, bids, asks, bid_sizes, ask_sizes, prices = [], [], [], [], [], []
+        nan = float('nan')
+        for symbol, bid, ask, bid_size, ask_size, price in rows:
+            assets.append(asset_factory(symbol))
+            bids.append(0.0 if bid is None else float(bid))
+            asks.append(0.0 if ask is None else float(ask))
+            bid_sizes.append(0 if bid_size is None else int(bid_size))
+            ask_sizes.append(0 if ask_size is None else int(ask_size))
+            prices.append(nan if price is None else float(price))
+
+        if numpy is not None:
+            bids = numpy.asarray(bids, dtype=numpy.float64)
+            asks = numpy.asarray(asks, dtype=numpy.float64)
+            prices = numpy.asarray(prices, dtype=numpy.float64)
+            spread_sum = bids + asks
+            prices = numpy.where(numpy.isnan(prices) & (spread_sum != 0.0),
+                                 0.5 * spread_sum, prices)
+        else:
+            prices = [0.5 * (b + a) if p != p and (b + a) != 0.0 else p
+                      for p, b, a in zip(prices, bids, asks)]
+
+        return cls(quote_date, assets, bids, asks, bid_sizes, ask_sizes, prices)
+
+    def __len__(self):
+        return len(self.assets)
+
+    def __getitem__(self, i):
+        price = self.prices[i]
+        return quote_factory(self.quote_date, self.assets[i],
+                             price=None if price != price else float(price),
+                             bid=float(self.bids[i]), ask=float(self.asks[i]),
+                             bid_size=self.bid_sizes[i], ask_size=self.ask_sizes[i])
 
 
 class Quote(object):
 
+    # quote objects are held by the million in streaming caches and chain
+    # loads; slots drop the per-instance dict
+    __slots__ = ('asset', 'quote_date', 'bid', 'ask', 'bid_size', 'ask_size', 'price', 'delta',
+                 '_quote_date_ns')
+
     def __init__(self, quote_date, asset, price=None, bid=0.0, ask=0.0, bid_size=0, ask_size=0):
-        self.asset = asset_factory(asset)
+        # resolved assets pass straight through; the factory (and its cache
+        # lookup) is only for symbols
+        self.asset = asset if isinstance(asset, Asset) else asset_factory(asset)
         self.quote_date = quote_date
-        self.bid = float(bid) if bid is not None else 0.0
-        self.ask = float(ask) if ask is not None else 0.0
-        self.bid_size = float(bid_size) if bid_size is not None else 0
-        self.ask_size = float(ask_size) if ask_size is not None else 0
-        self.price = float(price) if price is not None else None
+        self.bid = 0.0 if bid is None else float(bid)
+        self.ask = 0.0 if ask is None else float(ask)
+        # sizes are share/contract counts; keep them integral
+        self.bid_size = 0 if bid_size is None else int(bid_size)
+        self.ask_size = 0 if ask_size is None else int(ask_size)
+        self.price = None if price is None else float(price)
 
-        if self.price is None and self.bid + self.ask != 0.0:
-            self.price = ((self.bid + self.ask) / 2)
+        if self.price is None:
+            spread_sum = self.bid + self.ask
+            if spread_sum != 0.0:
+                self.price = 0.5 * spread_sum
 
         self.delta = 1.0
+        self._quote_date_ns = None
+
+    @property
+    def quote_date_ns(self):
+        """
+        quote_date as int nanoseconds since epoch, converted lazily and
+        cached, so bulk time analytics get a cheap int64 column without
+        taxing quotes whose date is only ever compared as a string.
+        """
+        ns = self._quote_date_ns
+        if ns is None and self.quote_date is not None:
+            ns = self._quote_date_ns = _to_epoch_ns(self.quote_date)
+        return ns
 
     def is_priceable(self):
         return self.price is not None
 
 
 class EquityQuote(Quote):
+    __slots__ = ()
     quote_type = "equity"
 
 
 class OptionQuote(Quote):
+    # days_to_exp is written by the Schwab adapter's fallback after
+    # construction, so it needs a slot even though __init__ doesn't set it
+    __slots__ = ('quote_type', 'days_to_expiration', 'days_to_exp', 'underlying_price',
+                 'strike', 'iv', 'gamma', 'vega', 'theta', 'rho', 'intrensic', 'c_type')
+
     def __init__(self, quote_date, asset, price = None, bid = 0.0, ask = 0.0, bid_size = 0, ask_size = 0, delta = None, iv = None, gamma = None, vega = None, theta = None, rho = None, underlying_price = None, days_to_exp = None, intrensic = None, strike = None, contract_type = None):
         super(OptionQuote, self).__init__(quote_date=quote_date, asset=asset, price=price, bid=bid, ask=ask, bid_size=bid_size, ask_size=ask_size)
         if not isinstance(self.asset, Option):
@@ -92,45 +233,57 @@ class OptionQuote(Quote):
         self.intrensic = intrensic
         self.c_type = contract_type if contract_type is not None else self.asset.option_type
         
-        def _safe(x):
-            if x is None:
-                return None
-            try:
-                x = float(x)
-            except Exception:
-                return None
-            return None if math.isnan(x) else x
-        
-        needs_compute = any(x is None for x in (self.delta, self.iv, self.gamma, self.vega, self.theta, self.rho)
-)
-        
-        if needs_compute and self.is_priceable() and self.underlying_price is not None:
-            greeks = get_option_greeks(self.asset.option_type, self.strike, self.underlying_price,
-                                       self.days_to_expiration, self.price, dividend=0.0)
-        
-            g = _safe(greeks.get("delta"))
-            if self.delta is None and g is not None:
-                self.delta = g * 100
-        
-            g = _safe(greeks.get("iv"))
-            if self.iv is None and g is not None:
-                self.iv = g * 100
-        
-            g = _safe(greeks.get("gamma"))
-            if self.gamma is None and g is not None:
-                self.gamma = g * 100
-        
-            g = _safe(greeks.get("vega"))
-            if self.vega is None and g is not None:
-                self.vega = g * 100
-        
-            g = _safe(greeks.get("theta"))
-            if self.theta is None and g is not None:
-                self.theta = g * 100
-        
-            g = _safe(greeks.get("rho"))
-            if self.rho is None and g is not None:
-                self.rho = g * 100
+        # fast path: Schwab/TD LEVELONE_OPTIONS normally deliver all six
+        # greeks, so the common construction ends right here
+        if delta is not None and iv is not None and gamma is not None \
+                and vega is not None and theta is not None and rho is not None:
+            return
+
+        if self.is_priceable() and self.underlying_price is not None:
+            greeks = _cached_greeks(self.asset.option_type, self.strike,
+                                    round(self.underlying_price * 100),
+                                    self.days_to_expiration,
+                                    round(self.price * 100))
+
+            # get_option_greeks returns floats or None, so a None test plus
+            # g == g (the branchless NaN filter) is all the guarding needed;
+            # with slots each setattr is a direct descriptor write
+            for key in _GREEK_KEYS:
+                g = greeks.get(key)
+                if g is not None and g == g and getattr(self, key) is None:
+                    setattr(self, key, g * 100)
+
+    @classmethod
+    def from_arrays(cls, quote_date, assets, prices, underlying_prices, bids=None, asks=None):
+        """
+        Bulk-construct OptionQuotes for one chain snapshot from aligned
+        sequences. Greeks for the whole chain come from a single
+        get_option_greeks_batch call instead of once per __init__, which is
+        what dominates load time on chains with thousands of strikes.
+        """
+        assets = [asset_factory(a) for a in assets]
+        days_to_exps = [a.get_days_to_expiration(quote_date) for a in assets]
+        greek_rows = get_option_greeks_batch(
+            [a.option_type for a in assets],
+            [a.strike for a in assets],
+            underlying_prices, days_to_exps, prices)
+
+        quotes = []
+        for i, asset in enumerate(assets):
+            g = greek_rows[i]
+            # same x100 scaling the per-instance compute path applies
+            scaled = {k: (g[k] * 100 if g.get(k) is not None and g[k] == g[k] else None)
+                      for k in _GREEK_KEYS}
+            quotes.append(cls(
+                quote_date, asset,
+                price=prices[i],
+                bid=bids[i] if bids is not None else 0.0,
+                ask=asks[i] if asks is not None else 0.0,
+                underlying_price=underlying_prices[i],
+                days_to_exp=days_to_exps[i],
+                **scaled,
+            ))
+        return quotes
 
     def has_greeks(self):
         return self.iv is not None
@@ -150,3 +303,11 @@ class OptionQuote(Quote):
     @property
     def expiration_date(self):
         return self.asset.expiration_date
+
+
+# streaming service name -> quote class, consumed by quote_factory_from_service
+_SERVICE_QUOTE_CLS = {
+    "LEVELONE_EQUITIES": EquityQuote,
+    "LEVELONE_OPTIONS": OptionQuote,
+    "LEVELONE_FUTURE_OPTIONS": OptionQuote,
+}
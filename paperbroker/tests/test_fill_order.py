@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import unittest
 
 from .TestDataQuoteAdapter import TestDataQuoteAdapter
@@ -108,6 +111,70 @@ class TestFillOrder(unittest.TestCase):
         assert a.positions[0].quantity == -1
 
 
+    def test_rejected_multileg_order_leaves_account_untouched(self):
+        # the bto leg is valid; the stc leg has no open position to close,
+        # so the up-front _validate_legs pass must reject the whole order
+        # before any cash, position or ledger mutation
+        self.quote_adapter.current_date = '2017-01-27'
+
+        a = Account()
+        a.cash = 1000
+
+        o = Order()
+        o.add_leg(asset='AAL170203P00046500', quantity=1, order_type='bto')
+        o.add_leg(asset='AAL170203P00047500', quantity=-1, order_type='stc')
+
+        # first pass only records the submit time (fills defer one message)
+        fill_order(account=a, order=o, quote_adapter=self.quote_adapter, estimator=MidpointEstimator())
+        assert a.cash == 1000
+        assert len(a.positions) == 0
+        assert len(a.ledger) == 0
+
+        self.quote_adapter.current_date = '2017-01-28'
+        with self.assertRaises(Exception):
+            fill_order(account=a, order=o, quote_adapter=self.quote_adapter, estimator=MidpointEstimator())
+
+        # the valid bto leg must not have been applied either
+        assert a.cash == 1000
+        assert len(a.positions) == 0
+        assert len(a.ledger) == 0
+        assert o.status == 'open'
+
+    def test_rejected_multileg_order_under_python_O(self):
+        # the in-loop leg checks are __debug__-only re-assertions, so the
+        # rejection must come from _validate_legs even under python -O;
+        # plain asserts would be elided there, hence the explicit raises
+        script = (
+            "if __debug__:\n"
+            "    raise SystemExit('expected to run under -O')\n"
+            "from paperbroker.tests.TestDataQuoteAdapter import TestDataQuoteAdapter\n"
+            "from paperbroker.accounts import Account\n"
+            "from paperbroker.orders import Order\n"
+            "from paperbroker.estimators import MidpointEstimator\n"
+            "from paperbroker.logic.fill_order import fill_order\n"
+            "quote_adapter = TestDataQuoteAdapter(current_date='2017-01-27')\n"
+            "a = Account()\n"
+            "a.cash = 1000\n"
+            "o = Order()\n"
+            "o.add_leg(asset='AAL170203P00046500', quantity=1, order_type='bto')\n"
+            "o.add_leg(asset='AAL170203P00047500', quantity=-1, order_type='stc')\n"
+            "fill_order(account=a, order=o, quote_adapter=quote_adapter, estimator=MidpointEstimator())\n"
+            "quote_adapter.current_date = '2017-01-28'\n"
+            "try:\n"
+            "    fill_order(account=a, order=o, quote_adapter=quote_adapter, estimator=MidpointEstimator())\n"
+            "except Exception:\n"
+            "    pass\n"
+            "else:\n"
+            "    raise SystemExit('order was not rejected under -O')\n"
+            "if a.cash != 1000 or a.positions or a.ledger or o.status != 'open':\n"
+            "    raise SystemExit('account mutated by a rejected order under -O')\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, '-O', '-c', script],
+                                cwd=repo_root, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,71 @@
+import unittest
+
+from .. import oco
+from ..oco import OCOBook, SIDE_BUY, SIDE_SELL, STATUS_OPEN, STATUS_FILLED, STATUS_CANCELED
+from ..quotes import QuoteTable
+
+"""
+    OCOBook is the column-oriented OCO scheduler: one row per child order,
+    evaluated against a QuoteTable snapshot. Buy rows fire on ask <= trigger,
+    sell rows on bid >= trigger; the first firing row of a group wins and its
+    open siblings are canceled. The scan has a NumPy path and a scalar
+    fallback which must agree row for row; parity is checked here by
+    stubbing oco.numpy to None.
+"""
+
+
+class TestOCOBook(unittest.TestCase):
+
+    def build_book(self):
+        book = OCOBook()
+        # group 1: both rows would fire; the first row must win
+        book.add(1, 10, 'AAL', 5.0, SIDE_BUY)
+        book.add(1, 11, 'GOOG', 800.0, SIDE_SELL)
+        # group 2: buy trigger out of reach, sell trigger hit
+        book.add(2, 20, 'AAL', 1.0, SIDE_BUY)
+        book.add(2, 21, 'GOOG', 100.0, SIDE_SELL)
+        # group 3: symbol absent from the snapshot, must never fire
+        book.add(3, 30, 'ZZZZ', 10.0, SIDE_BUY)
+        return book
+
+    def snapshot(self):
+        rows = [
+            ('AAL', 4.00, 4.50, 1, 1, None),
+            ('GOOG', 820.00, 821.00, 1, 1, None),
+        ]
+        return QuoteTable.from_service_rows('2017-01-27', rows)
+
+    def check_evaluate(self, book):
+        winners = book.evaluate(self.snapshot())
+
+        # one winner per group, first firing row wins
+        self.assertEqual(winners, [(1, 10), (2, 21)])
+        self.assertEqual(list(book.status), [STATUS_FILLED, STATUS_CANCELED,
+                                             STATUS_CANCELED, STATUS_FILLED,
+                                             STATUS_OPEN])
+
+        # a second pass over the same snapshot changes nothing; the
+        # missing-symbol row stays open
+        self.assertEqual(book.evaluate(self.snapshot()), [])
+        self.assertEqual(book.status[4], STATUS_OPEN)
+
+    def test_evaluate(self):
+        self.check_evaluate(self.build_book())
+
+    def test_evaluate_scalar_matches_numpy(self):
+        saved = oco.numpy
+        oco.numpy = None
+        try:
+            self.check_evaluate(self.build_book())
+        finally:
+            oco.numpy = saved
+
+    def test_empty_book_and_bad_side(self):
+        book = OCOBook()
+        self.assertEqual(book.evaluate(self.snapshot()), [])
+        with self.assertRaises(Exception):
+            book.add(1, 10, 'AAL', 5.0, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
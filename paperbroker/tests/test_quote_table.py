@@ -0,0 +1,68 @@
+import unittest
+
+from .. import quotes
+from ..quotes import QuoteTable, Quote, OptionQuote
+
+"""
+    QuoteTable is the column-oriented bulk loader: from_service_rows ingests
+    (symbol, bid, ask, bid_size, ask_size, price) tuples, fills missing mid
+    prices, and __getitem__ materializes Quote/OptionQuote objects lazily.
+    The mid-price fill has a NumPy path and a plain-list fallback; both are
+    exercised here by stubbing quotes.numpy to None.
+"""
+
+
+class TestQuoteTable(unittest.TestCase):
+
+    def build_table(self):
+        rows = [
+            ('AAL', 47.35, 47.37, 10, 12, None),                # mid fill
+            ('AAL170203P00046500', 0.49, 0.53, 5, 5, 0.50),     # explicit price kept
+            ('GOOG', None, None, None, None, None),             # zero spread, unpriceable
+        ]
+        return QuoteTable.from_service_rows('2017-01-27', rows)
+
+    def check_table(self, table):
+        self.assertEqual(len(table), 3)
+
+        # row with no price gets the mid of bid/ask
+        self.assertAlmostEqual(float(table.prices[0]), 47.36, places=2)
+        # explicit price is never overwritten by the mid fill
+        self.assertAlmostEqual(float(table.prices[1]), 0.50, places=2)
+        # zero-spread row stays NaN (unpriceable), not 0.0
+        self.assertNotEqual(table.prices[2], table.prices[2])
+
+        quote = table[0]
+        self.assertIsInstance(quote, Quote)
+        self.assertNotIsInstance(quote, OptionQuote)
+        self.assertEqual(quote.asset, 'AAL')
+        self.assertEqual(quote.quote_date, '2017-01-27')
+        self.assertAlmostEqual(quote.bid, 47.35, places=2)
+        self.assertAlmostEqual(quote.ask, 47.37, places=2)
+        self.assertAlmostEqual(quote.price, 47.36, places=2)
+        self.assertEqual(quote.bid_size, 10)
+        self.assertEqual(quote.ask_size, 12)
+
+        # option rows materialize as OptionQuote
+        option_quote = table[1]
+        self.assertIsInstance(option_quote, OptionQuote)
+        self.assertEqual(option_quote.asset, 'AAL170203P00046500')
+        self.assertAlmostEqual(option_quote.price, 0.50, places=2)
+
+        # unpriceable row comes back with price None
+        self.assertIsNone(table[2].price)
+
+    def test_from_service_rows(self):
+        self.check_table(self.build_table())
+
+    def test_from_service_rows_without_numpy(self):
+        saved = quotes.numpy
+        quotes.numpy = None
+        try:
+            self.check_table(self.build_table())
+        finally:
+            quotes.numpy = saved
+
+
+if __name__ == '__main__':
+    unittest.main()